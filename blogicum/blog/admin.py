@@ -46,6 +46,13 @@ class PostAdmin(admin.ModelAdmin):
     list_editable = (
         'is_published',
     )
+    list_select_related = (
+        'location',
+        'category'
+    )
+    raw_id_fields = (
+        'author',
+    )
 
 
 @admin.register(Comment)
@@ -56,6 +63,30 @@ class CommentAdmin(admin.ModelAdmin):
         'author',
         'created_at'
     )
+    list_select_related = (
+        'post',
+        'author'
+    )
+    raw_id_fields = (
+        'post',
+        'author'
+    )
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # Комментарий мог быть перенесён к другому посту
+        Post.objects.filter(
+            pk__in={obj.post_id, form.initial.get('post')}
+        ).recount_comments()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        Post.objects.filter(pk=obj.post_id).recount_comments()
+
+    def delete_queryset(self, request, queryset):
+        post_ids = set(queryset.values_list('post_id', flat=True))
+        super().delete_queryset(request, queryset)
+        Post.objects.filter(pk__in=post_ids).recount_comments()
 
 
 admin.site.empty_value_display = 'Не задано'
@@ -8,9 +8,17 @@ class PostForm(forms.ModelForm):
 
     class Meta:
         model = Post
-        exclude = ['author']
+        fields = [
+            'title',
+            'text',
+            'pub_date',
+            'location',
+            'category',
+            'image',
+            'is_published'
+        ]
         widgets = {
-            'post': forms.DateTimeInput(
+            'pub_date': forms.DateTimeInput(
                 format='%Y-%m-%dT%H:%M:%S',
                 attrs={'type': 'datetime-local'}
             )
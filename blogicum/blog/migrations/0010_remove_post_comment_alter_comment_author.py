@@ -0,0 +1,25 @@
+# Generated by Django 3.2.16 on 2026-10-15 09:12
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('blog', '0009_alter_post_comment'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='post',
+            name='comment',
+        ),
+        migrations.AlterField(
+            model_name='comment',
+            name='author',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to=settings.AUTH_USER_MODEL, verbose_name='Автор публикации'),
+        ),
+    ]
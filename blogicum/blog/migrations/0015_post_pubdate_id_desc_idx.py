@@ -0,0 +1,17 @@
+# Generated by Django 3.2.16 on 2026-10-15 12:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0014_post_author_pubdate_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-pub_date', '-id'], name='post_pubdate_id_desc_idx'),
+        ),
+    ]
@@ -1,12 +1,12 @@
 from typing import Any
 
-from django.db.models import Count
 from django.db.models.query import QuerySet
-from django.shortcuts import get_object_or_404, redirect
+from django.shortcuts import redirect
 from django.urls import reverse
 
 from .forms import PostForm
 from .models import Comment, Post
+from .paginators import KeysetPaginator
 
 PAGE_NUM = 10
 
@@ -23,17 +23,16 @@ class CommentDispatchMixin:
             args=(self.request.user.get_username(),)
         )
 
+    def get_object(self, queryset=None):
+        if not hasattr(self, '_cached_object'):
+            self._cached_object = super().get_object(queryset)
+        return self._cached_object
+
     def dispatch(self, request, *args, **kwargs):
-        comment = get_object_or_404(
-            Comment,
-            pk=kwargs['comment_id'],
-        )
-        if request.user == comment.author:
+        comment = self.get_object()
+        if request.user.id == comment.author_id:
             return super().dispatch(request, *args, **kwargs)
-        return redirect(reverse(
-            'blog:post_detail',
-            kwargs={'post_id': self.kwargs['post_id']}
-        ))
+        return redirect('blog:post_detail', post_id=self.kwargs['post_id'])
 
 
 class PostDispatchMixin:
@@ -44,17 +43,19 @@ class PostDispatchMixin:
     pk_url_kwarg = 'post_id'
     template_name = 'blog/create.html'
 
+    def get_queryset(self) -> QuerySet[Any]:
+        return super().get_queryset().select_related('location')
+
+    def get_object(self, queryset=None):
+        if not hasattr(self, '_cached_object'):
+            self._cached_object = super().get_object(queryset)
+        return self._cached_object
+
     def dispatch(self, request, *args, **kwargs):
-        post = get_object_or_404(
-            Post,
-            pk=kwargs['post_id'],
-        )
-        if request.user == post.author:
+        post = self.get_object()
+        if request.user.id == post.author_id:
             return super().dispatch(request, *args, **kwargs)
-        return redirect(reverse(
-            'blog:post_detail',
-            kwargs={'post_id': self.kwargs['post_id']}
-        ))
+        return redirect('blog:post_detail', post_id=self.kwargs['post_id'])
 
 
 class ListViewMixin:
@@ -62,10 +63,13 @@ class ListViewMixin:
     paginate_by = PAGE_NUM
 
     def get_queryset(self) -> QuerySet[Any]:
-        return super().get_queryset().select_related(
-            'author',
-            'location',
-            'category'
-        ).filter(
-            is_published=True
-        ).annotate(comment_count=Count('comments'))
+        return super().get_queryset().feed()
+
+
+class KeysetPaginationMixin:
+    '''Миксин пагинации ленты по курсору вместо номера страницы'''
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(queryset, page_size)
+        page = paginator.page(self.request.GET.get('after'))
+        return paginator, page, page.object_list, page.has_other_pages()
@@ -1,6 +1,9 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.urls import reverse
+from django.utils import timezone
 
 User = get_user_model()
 TITLE_LIMIT = 30
@@ -61,6 +64,52 @@ class Location(PublishedAndCreatedField):
         return self.name[:TITLE_LIMIT]
 
 
+class PostQuerySet(models.QuerySet):
+    """Набор запросов для публикаций."""
+
+    def with_related(self):
+        """Поля и связи, которые выводит карточка публикации."""
+        return self.select_related(
+            'author',
+            'location',
+            'category'
+        ).only(
+            'title',
+            'text',
+            'pub_date',
+            'image',
+            'is_published',
+            'author__username',
+            'location__name',
+            'location__is_published',
+            'category__title',
+            'category__slug',
+            'category__is_published',
+            'comment_count'
+        )
+
+    def published(self):
+        return self.filter(
+            is_published=True,
+            pub_date__lte=timezone.now()
+        )
+
+    def feed(self):
+        return self.with_related().published().filter(
+            category__is_published=True
+        )
+
+    def recount_comments(self):
+        """Пересчитывает comment_count по таблице комментариев."""
+        return self.update(comment_count=Coalesce(Subquery(
+            Comment.objects.filter(
+                post=OuterRef('pk')
+            ).order_by().values('post').annotate(
+                total=Count('pk')
+            ).values('total')
+        ), 0))
+
+
 class Post(PublishedAndCreatedField):
     """Модель постов связанный с моделями Location и Category."""
 
@@ -99,12 +148,38 @@ class Post(PublishedAndCreatedField):
         blank=True,
         upload_to='posts_images'
     )
+    comment_count = models.PositiveIntegerField(
+        'Количество комментариев',
+        default=0,
+        editable=False
+    )
+
+    objects = PostQuerySet.as_manager()
 
     class Meta:
         ordering = ('-pub_date',)
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         default_related_name = 'posts'
+        indexes = [
+            models.Index(
+                fields=['-pub_date', '-id'],
+                name='post_pubdate_id_desc_idx'
+            ),
+            models.Index(
+                fields=['-pub_date'],
+                condition=Q(is_published=True),
+                name='post_published_pubdate_idx'
+            ),
+            models.Index(
+                fields=['category', '-pub_date'],
+                name='post_category_pubdate_idx'
+            ),
+            models.Index(
+                fields=['author', '-pub_date'],
+                name='post_author_pubdate_idx'
+            ),
+        ]
 
     def get_absolute_url(self):
         '''С помощью функции reverse() возвращаем URL объекта.'''
@@ -124,7 +199,7 @@ class Comment(models.Model):
         related_name='comments',
         blank=False
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     author = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
@@ -134,6 +209,12 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ('created_at',)
+        indexes = [
+            models.Index(
+                fields=['post', 'created_at'],
+                name='comment_post_created_idx'
+            ),
+        ]
 
     def __str__(self):
         return self.title
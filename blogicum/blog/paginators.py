@@ -0,0 +1,71 @@
+from datetime import datetime
+
+from django.db.models import Q
+from django.http import Http404
+
+# Наибольшее значение BigAutoField; больший id база не примет
+MAX_CURSOR_ID = 2 ** 63 - 1
+
+
+class KeysetPage:
+    '''Страница ленты, выбранная по курсору (pub_date, id)'''
+
+    def __init__(self, object_list, next_cursor, is_first):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.is_first = is_first
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return not self.is_first
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    '''Пагинатор по ключу (pub_date, id) без OFFSET и COUNT(*)'''
+
+    def __init__(self, queryset, per_page):
+        self.queryset = queryset.order_by('-pub_date', '-id')
+        self.per_page = per_page
+
+    @staticmethod
+    def make_cursor(post):
+        return f'{post.pub_date.isoformat()},{post.pk}'
+
+    @staticmethod
+    def parse_cursor(cursor):
+        try:
+            pub_date, pk = cursor.rsplit(',', 1)
+            pub_date, pk = datetime.fromisoformat(pub_date), int(pk)
+        except ValueError:
+            raise Http404('Некорректный курсор страницы.')
+        if not 0 < pk <= MAX_CURSOR_ID:
+            raise Http404('Некорректный курсор страницы.')
+        return pub_date, pk
+
+    def page(self, cursor=None):
+        queryset = self.queryset
+        if cursor:
+            pub_date, pk = self.parse_cursor(cursor)
+            queryset = queryset.filter(
+                Q(pub_date__lt=pub_date) | Q(pub_date=pub_date, id__lt=pk)
+            )
+        object_list = list(queryset[:self.per_page + 1])
+        next_cursor = None
+        if len(object_list) > self.per_page:
+            object_list = object_list[:self.per_page]
+            next_cursor = self.make_cursor(object_list[-1])
+        return KeysetPage(object_list, next_cursor, is_first=not cursor)
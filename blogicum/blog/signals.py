@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, pre_delete
+from django.dispatch import receiver
+
+from .models import Comment, Post, User
+
+
+@receiver(pre_delete, sender=User)
+def remember_commented_posts(sender, instance, **kwargs):
+    '''Запоминает посты, комментарии к которым удалятся вместе с автором'''
+    instance._commented_post_ids = set(
+        Comment.objects.filter(author=instance).values_list(
+            'post_id', flat=True
+        )
+    )
+
+
+@receiver(post_delete, sender=User)
+def recount_commented_posts(sender, instance, **kwargs):
+    '''Пересчитывает комментарии постов, затронутых удалением автора'''
+    post_ids = getattr(instance, '_commented_post_ids', None)
+    if post_ids:
+        Post.objects.filter(pk__in=post_ids).recount_comments()
@@ -1,8 +1,11 @@
+from math import ceil
 from typing import Any, Dict
 
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Count
+from django.core.paginator import Paginator
+from django.db.models import F
 from django.db.models.query import QuerySet
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
@@ -10,23 +13,17 @@ from django.views.generic import (CreateView, DeleteView, DetailView, ListView,
                                   UpdateView)
 
 from .forms import CommentForm, PostForm, ProfileForm
-from .mixins import CommentDispatchMixin, ListViewMixin, PostDispatchMixin
+from .mixins import (CommentDispatchMixin, KeysetPaginationMixin,
+                     ListViewMixin, PostDispatchMixin)
 from .models import Category, Comment, Post, User
 
-PAGE_NUM = 10
+COMMENTS_PER_PAGE = 20
 
 
-class IndexListView(ListViewMixin, ListView):
+class IndexListView(KeysetPaginationMixin, ListViewMixin, ListView):
     """CBV для ленты записей."""
 
     template_name = 'blog/index.html'
-    ordering = ('-pub_date',)
-
-    def get_queryset(self) -> QuerySet[Any]:
-        return super().get_queryset().filter(
-            pub_date__lte=timezone.now(),
-            category__is_published=True
-        )
 
 
 class CommentUpdateView(LoginRequiredMixin, CommentDispatchMixin, UpdateView):
@@ -38,32 +35,30 @@ class CommentUpdateView(LoginRequiredMixin, CommentDispatchMixin, UpdateView):
 class CommentDeleteView(LoginRequiredMixin, CommentDispatchMixin, DeleteView):
     '''CBV удаления комментария'''
 
-    pass
+    def delete(self, request, *args, **kwargs):
+        response = super().delete(request, *args, **kwargs)
+        Post.objects.filter(pk=self.object.post_id).update(
+            comment_count=F('comment_count') - 1
+        )
+        return response
 
 
-class ProfileListView(ListViewMixin, ListView):
+class ProfileListView(KeysetPaginationMixin, ListViewMixin, ListView):
     '''CBV профиля пользователя'''
 
     template_name = 'blog/profile.html'
-    ordering = ('-pub_date',)
 
     def get_queryset(self) -> QuerySet[Any]:
-        self.username = get_object_or_404(
-            User, username=self.kwargs['username']
-        )
+        if self.kwargs['username'] == self.request.user.get_username():
+            self.username = self.request.user
+        else:
+            self.username = get_object_or_404(
+                User, username=self.kwargs['username']
+            )
+        posts = Post.objects.filter(author=self.username)
         if self.username == self.request.user:
-            # Без добавления order_by('-pub_date') тесты не проходят
-            # Если убрать ordering в атрибутах тесты проваливаются
-            return Post.objects.select_related(
-                'author',
-                'location',
-                'category'
-            ).filter(
-                author=self.username
-            ).annotate(comment_count=Count('comments')).order_by('-pub_date')
-        return super().get_queryset().filter(
-            pub_date__lte=timezone.now()
-        )
+            return posts.with_related()
+        return posts.feed()
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         context = super().get_context_data(**kwargs)
@@ -93,7 +88,6 @@ class CategoryListView(LoginRequiredMixin, ListViewMixin, ListView):
     '''CBV опубликованных категорий'''
 
     template_name = 'blog/category.html'
-    ordering = ('-pub_date')
     category = None
 
     def get_queryset(self):
@@ -102,9 +96,7 @@ class CategoryListView(LoginRequiredMixin, ListViewMixin, ListView):
             slug=self.kwargs['category_slug'],
             is_published=True
         )
-        return super().get_queryset().filter(
-            pub_date__lte=timezone.now(),
-            category__is_published=True,
+        return Post.objects.with_related().published().filter(
             category=self.category
         )
 
@@ -123,9 +115,6 @@ class PostCreateView(LoginRequiredMixin, CreateView):
 
     def form_valid(self, form):
         form.instance.author = self.request.user
-        if form.instance.pub_date > timezone.now():
-            form.instance.published = False
-            form.instance.save()
         return super().form_valid(form)
 
     def get_success_url(self):
@@ -143,25 +132,32 @@ class PostDetailView(DetailView):
     template_name = 'blog/detail.html'
     pk_url_kwarg = 'post_id'
 
+    def get_queryset(self) -> QuerySet[Any]:
+        return super().get_queryset().with_related()
+
     def get_object(self):
         post = super().get_object()
-        author = post.author
-        if not self.request.user.is_authenticated or (
-            author != self.request.user
+        if post.author_id != self.request.user.id and not (
+            post.is_published
+            and post.pub_date <= timezone.now()
+            and post.category is not None
+            and post.category.is_published
         ):
-            post = get_object_or_404(
-                Post,
-                is_published=True,
-                pk=self.kwargs['post_id'],
-                pub_date__lte=timezone.now(),
-                category__is_published=True,
-            )
+            raise Http404
         return post
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = Comment.objects.filter(post=self.object)
+        comments = self.object.comments.select_related('author').only(
+            'text',
+            'created_at',
+            'post',
+            'author__username'
+        )
+        context['comments'] = Paginator(
+            comments, COMMENTS_PER_PAGE
+        ).get_page(self.request.GET.get('cpage'))
         return context
 
 
@@ -180,9 +176,7 @@ class PostDeleteView(LoginRequiredMixin, PostDispatchMixin, DeleteView):
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
-        context['form'] = PostForm(
-            instance=Post.objects.get(pk=self.kwargs['post_id'])
-        )
+        context['form'] = PostForm(instance=self.object)
         return context
 
     def get_success_url(self):
@@ -201,13 +195,26 @@ class CommentCreateView(LoginRequiredMixin, CreateView):
     pk_url_kwarg = 'post_id'
 
     def form_valid(self, form):
-        post = get_object_or_404(Post, pk=self.kwargs['post_id'])
+        post = get_object_or_404(
+            Post.objects.only('pk'),
+            pk=self.kwargs['post_id']
+        )
         form.instance.author = self.request.user
         form.instance.post = post
-        return super().form_valid(form)
+        response = super().form_valid(form)
+        Post.objects.filter(pk=post.pk).update(
+            comment_count=F('comment_count') + 1
+        )
+        return response
 
     def get_success_url(self):
-        return reverse(
+        # Комментарии идут по возрастанию даты: новый — на последней странице
+        count = Comment.objects.filter(post_id=self.object.post_id).count()
+        url = reverse(
             'blog:post_detail',
             kwargs={"post_id": self.kwargs["post_id"]}
         )
+        return (
+            f'{url}?cpage={ceil(count / COMMENTS_PER_PAGE)}'
+            f'#comment_{self.object.pk}'
+        )
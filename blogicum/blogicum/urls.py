@@ -1,84 +1,36 @@
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.contrib.auth import views
 from django.contrib.auth.forms import UserCreationForm
 from django.urls import include, path, reverse_lazy
 from django.views.generic.edit import CreateView
 
+registration_view = CreateView.as_view(
+    template_name='registration/registration_form.html',
+    form_class=UserCreationForm,
+    success_url=reverse_lazy('blog:index'),
+)
+
+auth_patterns = [
+    path('registration/', registration_view, name='registration'),
+    path('', include('django.contrib.auth.urls')),
+]
+
 urlpatterns = [
-    path('admin/', admin.site.urls),
-    path(
-        'auth/registration/',
-        CreateView.as_view(
-            template_name='registration/registration_form.html',
-            form_class=UserCreationForm,
-            success_url=reverse_lazy('blog:index'),
-        ),
-        name='registration',
-    ),
-    path(
-        'auth/password_change/',
-        views.PasswordChangeView.as_view(
-            template_name='registration/password_change_form.html'
-        ),
-        name='password_change',
-    ),
-    path('auth/', include('django.contrib.auth.urls')),
-    path(
-        'logout/',
-        views.LogoutView.as_view(template_name='registration/logged_out.html'),
-        name='logout',
-    ),
-    path(
-        'login/',
-        views.LoginView.as_view(template_name='registration/login.html'),
-        name='login',
-    ),
-    path(
-        'password_change/done/',
-        views.PasswordChangeDoneView.as_view(
-            template_name='registration/password_change_done.html'
-        ),
-        name='password_change_done',
-    ),
-    path(
-        'password_reset/',
-        views.PasswordResetView.as_view(
-            template_name='registration/password_reset_form.html'
-        ),
-        name='password_reset',
-    ),
-    path(
-        'password_reset/done/',
-        views.PasswordResetDoneView.as_view(
-            template_name='registration/password_reset_done.html'
-        ),
-        name='password_reset_done',
-    ),
-    path(
-        'reset/<uidb64>/<token>/',
-        views.PasswordResetConfirmView.as_view(
-            template_name='registration/password_reset_confirm.html'
-        ),
-        name='reset',
-    ),
-    path(
-        'reset/done/',
-        views.PasswordResetCompleteView.as_view(
-            template_name='registration/password_reset_complete.html'
-        ),
-        name='reset_done',
-    ),
+    path('', include('blog.urls')),
     path('pages/', include('pages.urls')),
-    path('', include('blog.urls'))
+    path('auth/', include(auth_patterns)),
 ]
 
-if settings.DEBUG:
-    import debug_toolbar
-    urlpatterns += (path('__debug__/', include(debug_toolbar.urls)),)
+if settings.ENABLE_ADMIN:
+    urlpatterns.insert(0, path('admin/', admin.site.urls))
 
-urlpatterns + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+if settings.DEBUG:
+    urlpatterns.insert(0, path('__debug__/', include('debug_toolbar.urls')))
+    # В продакшене MEDIA_URL раздаёт веб-сервер (nginx), а не Django
+    urlpatterns += static(
+        settings.MEDIA_URL, document_root=settings.MEDIA_ROOT
+    )
 
 handler404 = 'pages.views.page_not_found'
 handler500 = 'pages.views.tr_handler500'
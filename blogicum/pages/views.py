@@ -1,6 +1,17 @@
-from django.shortcuts import render
+from functools import lru_cache
+
+from django.http import (HttpResponseForbidden, HttpResponseNotFound,
+                         HttpResponseServerError)
+from django.template import Context
+from django.template.loader import get_template
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.cache import cache_control
 from django.views.generic import TemplateView
 
+PAGE_NOT_FOUND_TEMPLATE = get_template('pages/404.html')
+CSRF_FAILURE_TEMPLATE = get_template('pages/403csrf.html')
+SERVER_ERROR_TEMPLATE = get_template('pages/500.html')
+
 
 class AboutTemplateView(TemplateView):
     template_name = 'pages/about.html'
@@ -10,13 +21,40 @@ class RulesTemplateView(TemplateView):
     template_name = 'pages/rules.html'
 
 
+@cache_control(public=True, max_age=60)
 def page_not_found(request, exception):
-    return render(request, 'pages/404.html', status=404)
+    # Контекст-процессоры (user, messages) странице 404 не нужны
+    response = HttpResponseNotFound(
+        PAGE_NOT_FOUND_TEMPLATE.template.render(Context({'request': request}))
+    )
+    # Автор видит свою неопубликованную запись там, где другим отдаётся 404
+    patch_vary_headers(response, ('Cookie',))
+    return response
+
+
+@lru_cache(maxsize=None)
+def csrf_failure_body():
+    '''Страница 403 CSRF: одинакова для всех, рендерится один раз'''
+    return CSRF_FAILURE_TEMPLATE.render().encode('utf-8')
 
 
 def csrf_failure(request, reason=''):
-    return render(request, 'pages/403csrf.html', status=403)
+    return HttpResponseForbidden(
+        csrf_failure_body(), content_type='text/html; charset=utf-8'
+    )
+
+
+@lru_cache(maxsize=None)
+def server_error_body():
+    '''Страница 500 без данных запроса: рендерится один раз и переиспользуется
+
+    Не рендерим при импорте: {% url %} в шаблоне обратился бы
+    к ещё не загруженному URLconf.
+    '''
+    return SERVER_ERROR_TEMPLATE.render().encode('utf-8')
 
 
 def tr_handler500(request):
-    return render(request=request, template_name='pages/500.html', status=500)
+    return HttpResponseServerError(
+        server_error_body(), content_type='text/html; charset=utf-8'
+    )
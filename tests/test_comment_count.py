@@ -0,0 +1,44 @@
+import pytest
+
+
+@pytest.mark.django_db
+def test_comment_count_follows_comments(
+        user_client, post_with_published_location, CommentModel
+):
+    post = post_with_published_location
+    initial_count = post.comment_count
+
+    user_client.post(
+        f"/posts/{post.id}/comment/", data={"text": "Новый комментарий"}
+    )
+    post.refresh_from_db()
+    assert post.comment_count == initial_count + 1, (
+        "Убедитесь, что после добавления комментария поле `comment_count`"
+        " публикации увеличивается на единицу."
+    )
+
+    comment = CommentModel.objects.get(post=post)
+    user_client.post(f"/posts/{post.id}/delete_comment/{comment.id}/")
+    post.refresh_from_db()
+    assert post.comment_count == initial_count, (
+        "Убедитесь, что после удаления комментария поле `comment_count`"
+        " публикации уменьшается на единицу."
+    )
+
+
+@pytest.mark.django_db
+def test_comment_count_after_commenter_deleted(
+        another_user, another_user_client, post_with_published_location
+):
+    post = post_with_published_location
+    initial_count = post.comment_count
+
+    another_user_client.post(
+        f"/posts/{post.id}/comment/", data={"text": "Новый комментарий"}
+    )
+    another_user.delete()
+    post.refresh_from_db()
+    assert post.comment_count == initial_count == post.comments.count(), (
+        "Убедитесь, что при удалении пользователя поле `comment_count`"
+        " публикаций, которые он комментировал, пересчитывается."
+    )
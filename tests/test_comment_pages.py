@@ -0,0 +1,46 @@
+from http import HTTPStatus
+
+import pytest
+from mixer.backend.django import Mixer
+
+COMMENTS_PER_PAGE = 20
+
+
+@pytest.mark.django_db
+def test_comments_cpage(
+        mixer: Mixer, CommentModel, post_with_published_location,
+        unlogged_client
+):
+    post = post_with_published_location
+    comments = mixer.cycle(COMMENTS_PER_PAGE + 1).blend(
+        CommentModel, post=post
+    )
+    response = unlogged_client.get(f"/posts/{post.id}/", {"cpage": 2})
+    assert response.status_code == HTTPStatus.OK
+    page = response.context["comments"]
+    assert [comment.id for comment in page] == [comments[-1].id], (
+        "Убедитесь, что параметр `?cpage=` открывает нужную страницу"
+        " комментариев к публикации."
+    )
+
+
+@pytest.mark.django_db
+def test_new_comment_on_last_page(
+        mixer: Mixer, CommentModel, post_with_published_location,
+        user_client
+):
+    post = post_with_published_location
+    mixer.cycle(COMMENTS_PER_PAGE).blend(CommentModel, post=post)
+    response = user_client.post(
+        f"/posts/{post.id}/comment/",
+        data={"text": "Новый комментарий"},
+        follow=True,
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.redirect_chain[-1][0].startswith(
+        f"/posts/{post.id}/?cpage=2"
+    ), (
+        "Убедитесь, что после добавления комментария пользователь попадает"
+        " на последнюю страницу комментариев."
+    )
+    assert "Новый комментарий" in response.content.decode("utf-8")
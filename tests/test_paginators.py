@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+import pytest
+import pytz
+from mixer.backend.django import Mixer
+
+from conftest import N_PER_PAGE
+
+
+def collect_index_pages(client):
+    pages = []
+    params = {}
+    while params is not None:
+        response = client.get("/", params)
+        assert response.status_code == HTTPStatus.OK
+        page = response.context["page_obj"]
+        pages.append([post.id for post in page])
+        params = {"after": page.next_cursor} if page.has_next() else None
+    return pages
+
+
+@pytest.mark.django_db
+def test_keyset_next_page(mixer: Mixer, user, published_category, client):
+    now = datetime.now(tz=pytz.UTC)
+    posts = mixer.cycle(N_PER_PAGE + 3).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=(now - timedelta(hours=i) for i in range(N_PER_PAGE + 3)),
+    )
+    pages = collect_index_pages(client)
+    assert [len(page) for page in pages] == [N_PER_PAGE, 3], (
+        "Убедитесь, что по ссылке `?after=` открывается следующая страница"
+        " ленты с оставшимися публикациями."
+    )
+    assert sum(pages, []) == [post.id for post in posts], (
+        "Убедитесь, что публикации в ленте идут от новых к старым"
+        " и не повторяются между страницами."
+    )
+
+
+@pytest.mark.django_db
+def test_keyset_equal_pub_date(
+        mixer: Mixer, user, published_category, client
+):
+    pub_date = datetime.now(tz=pytz.UTC) - timedelta(days=1)
+    posts = mixer.cycle(N_PER_PAGE * 2 + 1).blend(
+        "blog.Post",
+        author=user,
+        category=published_category,
+        is_published=True,
+        pub_date=pub_date,
+    )
+    post_ids = sum(collect_index_pages(client), [])
+    assert sorted(post_ids) == sorted(post.id for post in posts), (
+        "Убедитесь, что публикации с одинаковой датой не теряются"
+        " и не повторяются при переходе между страницами ленты."
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "garbage",
+        "2020-01-01T00:00:00",
+        "2020-01-01T00:00:00,abc",
+        "2020-01-01T00:00:00,-1",
+        "2020-01-01T00:00:00,99999999999999999999999",
+    ]
+)
+def test_keyset_malformed_cursor(client, cursor):
+    response = client.get("/", {"after": cursor})
+    assert response.status_code == HTTPStatus.NOT_FOUND, (
+        "Убедитесь, что для некорректного значения `?after=` лента"
+        " возвращает ошибку 404."
+    )
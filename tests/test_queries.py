@@ -0,0 +1,64 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from mixer.backend.django import Mixer
+
+from conftest import N_PER_PAGE
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("url_template", "page_name"),
+    [
+        ("/", "главной странице"),
+        ("/profile/{username}/", "странице пользователя"),
+        ("/category/{slug}/", "странице категории"),
+    ],
+    ids=["index", "profile", "category"]
+)
+def test_feed_query_count(
+        mixer: Mixer, user, published_category, user_client,
+        url_template, page_name
+):
+    url = url_template.format(
+        username=user.username, slug=published_category.slug
+    )
+    mixer.blend("blog.Post", author=user, category=published_category)
+    with CaptureQueriesContext(connection) as few_posts_queries:
+        user_client.get(url)
+
+    mixer.cycle(N_PER_PAGE).blend(
+        "blog.Post", author=user, category=published_category
+    )
+    with CaptureQueriesContext(connection) as many_posts_queries:
+        user_client.get(url)
+
+    assert len(many_posts_queries) == len(few_posts_queries), (
+        f"Убедитесь, что количество запросов к базе данных на {page_name}"
+        " не зависит от количества публикаций: связанные объекты"
+        " должны загружаться через `select_related()`, а в шаблонах"
+        " должно использоваться поле `comment_count` вместо"
+        " `post.comments.count`."
+    )
+
+
+@pytest.mark.django_db
+def test_post_detail_query_count(
+        mixer: Mixer, CommentModel, post_with_published_location,
+        unlogged_client
+):
+    post = post_with_published_location
+    url = f"/posts/{post.id}/"
+    mixer.blend(CommentModel, post=post)
+    with CaptureQueriesContext(connection) as few_comments_queries:
+        unlogged_client.get(url)
+
+    mixer.cycle(N_PER_PAGE).blend(CommentModel, post=post)
+    with CaptureQueriesContext(connection) as many_comments_queries:
+        unlogged_client.get(url)
+
+    assert len(many_comments_queries) == len(few_comments_queries), (
+        "Убедитесь, что количество запросов к базе данных на странице"
+        " публикации не зависит от количества комментариев: авторы"
+        " комментариев должны загружаться вместе с комментариями."
+    )